@@ -15,7 +15,6 @@
 # python3
 """Contains cloud authentication related functionality."""
 
-import logging
 from typing import List
 from urllib import parse
 
@@ -43,9 +42,8 @@ def retrieve_version_info(client_id: str, scopes: List[str],
   encoded_request = parse.urlencode(
       version_info_request, quote_via=parse.quote)
   url = f'{_BASE_URL}?{encoded_request}'
-  logging.info(
-      'Please click on the URL below to authorize %s and paste the '
-      'authorization code.', app_name)
-  logging.info('URL - %s', url)
+  print(f'Please click on the URL below to authorize {app_name} and paste the '
+        'authorization code.')
+  print(f'URL - {url}')
 
   return input('Authorization Code : ')
@@ -15,20 +15,67 @@
 # python3
 """Cloud BigQuery module."""
 
+import functools
 import logging
 import pathlib
 import typing
 
+import google.auth
+from google.auth.transport import requests as google_auth_requests
 from google.cloud import bigquery
-from google.cloud import exceptions
+from requests import adapters
 
 
 # Main workflow sql.
 _MAIN_WORKFLOW_SQL = 'sql/main_workflow.sql'
+# Size of the HTTP connection pool used by the BigQuery client.
+_HTTP_POOL_SIZE = 32
 
-# Set logging level.
-logging.getLogger().setLevel(logging.INFO)
-logging.getLogger('googleapiclient.discovery').setLevel(logging.WARNING)
+# Schema of data/language_codes.csv.
+_LANGUAGE_CODES_SCHEMA = [
+    bigquery.SchemaField('language_name', 'STRING'),
+    bigquery.SchemaField('language_code', 'STRING'),
+    bigquery.SchemaField('criterion_id', 'INTEGER'),
+]
+# Schema of data/geo_targets.csv.
+_GEO_TARGETS_SCHEMA = [
+    bigquery.SchemaField('criteria_id', 'INTEGER'),
+    bigquery.SchemaField('name', 'STRING'),
+    bigquery.SchemaField('canonical_name', 'STRING'),
+    bigquery.SchemaField('parent_id', 'INTEGER'),
+    bigquery.SchemaField('country_code', 'STRING'),
+    bigquery.SchemaField('target_type', 'STRING'),
+    bigquery.SchemaField('status', 'STRING'),
+]
+
+logger = logging.getLogger(__name__)
+
+
+def _make_http() -> google_auth_requests.AuthorizedSession:
+  """Returns an authorized session with an enlarged connection pool.
+
+  The default pool of the requests library only keeps 10 connections per
+  host, which is too small once several BigQuery jobs are in flight.
+  """
+  credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+  session = google_auth_requests.AuthorizedSession(credentials)
+  adapter = adapters.HTTPAdapter(
+      pool_connections=_HTTP_POOL_SIZE,
+      pool_maxsize=_HTTP_POOL_SIZE,
+      pool_block=False,
+  )
+  session.mount('https://', adapter)
+  return session
+
+
+@functools.lru_cache(maxsize=None)
+def _get_bq_client(project_id: str) -> bigquery.Client:
+  """Returns a BigQuery client for the project, shared across calls.
+
+  Args:
+    project_id: Cloud project ID.
+  """
+  return bigquery.Client(project=project_id, _http=_make_http())
 
 
 def create_dataset_if_not_exists(
@@ -41,35 +88,38 @@ def create_dataset_if_not_exists(
     dataset_id: BigQuery dataset ID.
     dataset_location: location of BigQuery dataset.
   """
-  # Construct a BigQuery client object.
-  client = bigquery.Client(project=project_id)
+  client = _get_bq_client(project_id)
   fully_qualified_dataset_id = f'{project_id}.{dataset_id}'
-  try:
-    client.get_dataset(fully_qualified_dataset_id)
-    logging.info('Dataset %s already exists.', fully_qualified_dataset_id)
-  except exceptions.NotFound:
-    logging.info('Dataset %s is not found.', fully_qualified_dataset_id)
-    dataset = bigquery.Dataset(fully_qualified_dataset_id)
-    dataset.location = dataset_location
-    client.create_dataset(dataset)
-    logging.info('Dataset %s created.', fully_qualified_dataset_id)
+  dataset = bigquery.Dataset(fully_qualified_dataset_id)
+  dataset.location = dataset_location
+  client.create_dataset(dataset, exists_ok=True)
+  logger.info('Dataset %s is available.', fully_qualified_dataset_id)
 
 
-def load_language_codes(project_id: str, dataset_id: str) -> None:
-  """Loads language codes.
+def _load_csv(
+    project_id: str,
+    dataset_id: str,
+    table_name: str,
+    file_name: str,
+    schema: typing.List[bigquery.SchemaField],
+) -> None:
+  """Loads CSV file into BigQuery table.
 
   Args:
     project_id: Cloud project ID.
     dataset_id: BigQuery dataset ID.
+    table_name: Name of the destination table.
+    file_name: Path to the CSV file.
+    schema: Schema of the CSV file.
   """
-  client = bigquery.Client(project=project_id)
-  fully_qualified_table_id = f'{project_id}.{dataset_id}.language_codes'
+  client = _get_bq_client(project_id)
+  fully_qualified_table_id = f'{project_id}.{dataset_id}.{table_name}'
   job_config = bigquery.LoadJobConfig(
       source_format=bigquery.SourceFormat.CSV,
       skip_leading_rows=1,
-      autodetect=True,
+      schema=schema,
+      autodetect=False,
   )
-  file_name = 'data/language_codes.csv'
   with open(file_name, 'rb') as source_file:
     job = client.load_table_from_file(
         source_file, fully_qualified_table_id, job_config=job_config
@@ -78,6 +128,22 @@ def load_language_codes(project_id: str, dataset_id: str) -> None:
   job.result()
 
 
+def load_language_codes(project_id: str, dataset_id: str) -> None:
+  """Loads language codes.
+
+  Args:
+    project_id: Cloud project ID.
+    dataset_id: BigQuery dataset ID.
+  """
+  _load_csv(
+      project_id,
+      dataset_id,
+      'language_codes',
+      'data/language_codes.csv',
+      _LANGUAGE_CODES_SCHEMA,
+  )
+
+
 def load_geo_targets(project_id: str, dataset_id: str) -> None:
   """Loads geo targets.
 
@@ -85,20 +151,23 @@ def load_geo_targets(project_id: str, dataset_id: str) -> None:
     project_id: Cloud project ID.
     dataset_id: BigQuery dataset ID.
   """
-  client = bigquery.Client(project=project_id)
-  fully_qualified_table_id = f'{project_id}.{dataset_id}.geo_targets'
-  job_config = bigquery.LoadJobConfig(
-      source_format=bigquery.SourceFormat.CSV,
-      skip_leading_rows=1,
-      autodetect=True,
+  _load_csv(
+      project_id,
+      dataset_id,
+      'geo_targets',
+      'data/geo_targets.csv',
+      _GEO_TARGETS_SCHEMA,
   )
-  file_name = 'data/geo_targets.csv'
-  with open(file_name, 'rb') as source_file:
-    job = client.load_table_from_file(
-        source_file, fully_qualified_table_id, job_config=job_config
-    )
 
-  job.result()
+
+@functools.lru_cache(maxsize=None)
+def _load_sql(sql_path: str) -> str:
+  """Returns contents of SQL script, read from disk only once per path.
+
+  Args:
+    sql_path: Path to SQL script.
+  """
+  return pathlib.Path(sql_path).read_text()
 
 
 def configure_sql(
@@ -113,7 +182,7 @@ def configure_sql(
   Returns:
     sql_script: String representation of SQL script with parameters assigned.
   """
-  sql_script = pathlib.Path(sql_path).read_text()
+  sql_script = _load_sql(sql_path)
 
   params = {}
   for param_key, param_value in query_params.items():
@@ -143,11 +212,11 @@ def execute_queries(
     merchant_id: Merchant center ID.
     customer_id: Google Ads customer ID.
   """
-  # Sql files to be executed in a specific order.
-  sql_files = [
+  # Sql files that do not depend on each other. They are submitted together
+  # as a single multi-statement script.
+  setup_sql_files = [
       'sql/inventory.sql',
       'sql/best_sellers.sql',
-      _MAIN_WORKFLOW_SQL,
   ]
   query_params = {
       'project_id': project_id,
@@ -155,15 +224,24 @@ def execute_queries(
       'merchant_id': merchant_id,
       'external_customer_id': customer_id,
   }
-  client = bigquery.Client(project=project_id)
-  for sql_file in sql_files:
-    try:
-      query = configure_sql(sql_file, query_params)
-      query_job = client.query(query, location=dataset_location)
-      query_job.result()
-    except:
-      logging.exception('Error in %s', sql_file)
-      raise
+  client = _get_bq_client(project_id)
+  try:
+    # Every statement in the files is already terminated with a semicolon.
+    query = '\n'.join(
+        configure_sql(sql_file, query_params) for sql_file in setup_sql_files
+    )
+    client.query(query, location=dataset_location).result()
+  except:
+    logger.exception('Error in %s', ', '.join(setup_sql_files))
+    raise
+
+  # The main workflow calls the procedures created by the files above.
+  try:
+    query = configure_sql(_MAIN_WORKFLOW_SQL, query_params)
+    client.query(query, location=dataset_location).result()
+  except:
+    logger.exception('Error in %s', _MAIN_WORKFLOW_SQL)
+    raise
 
 
 def get_main_workflow_sql(
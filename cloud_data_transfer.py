@@ -15,22 +15,30 @@
 # python3
 """Module for managing BigQuery data transfers."""
 
-import copy
+from __future__ import annotations
+
+import asyncio
 import datetime
+import functools
 import logging
+import random
 import time
-from typing import Dict, Optional
+import types
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 import auth
 import google.auth
+import google.auth.credentials
 from google.auth import impersonated_credentials
 from google.auth.exceptions import DefaultCredentialsError
-from google.cloud import bigquery_datatransfer
-from google.cloud.bigquery_datatransfer_v1.types import TransferConfig
-from google.cloud.bigquery_datatransfer_v1.types import TransferState
 from google.protobuf import struct_pb2
 from google.protobuf import timestamp_pb2
-import pytz
+
+if TYPE_CHECKING:
+  from google.cloud import bigquery_datatransfer
+  from google.cloud.bigquery_datatransfer_v1.types import TransferConfig
+
+logger = logging.getLogger(__name__)
 
 # The unique identifier for the Merchant Center data source.
 _MERCHANT_CENTER_ID = 'merchant_center'
@@ -39,10 +47,23 @@ _GOOGLE_ADS_ID = 'google_ads'
 # The unique identifier for the Scheduled Query data source.
 _SCHEDULED_QUERY_ID = 'scheduled_query'
 
-# Polling interval in seconds between transfer status checks.
-_SLEEP_SECONDS = 60
-# Maximum number of polling attempts to prevent infinite loops.
-_MAX_POLL_COUNTER = 100
+# Initial polling interval in seconds between transfer status checks. It
+# doubles after each check.
+_INITIAL_SLEEP_SECONDS = 10
+# Upper bound of the polling interval in seconds.
+_MAX_SLEEP_SECONDS = 300
+# Upper bound of the random jitter in seconds added to each polling interval.
+_SLEEP_JITTER_SECONDS = 5
+# Maximum time in seconds to wait for a transfer to prevent infinite loops.
+# Merchant Center transfers can take up to 90 minutes on the first run.
+_MAX_WAIT_SECONDS = 2 * 60 * 60
+# Number of times to re-check a transfer that has no runs yet, and the interval
+# in seconds between these checks. Runs of a newly created transfer may take a
+# few seconds to be listed.
+_MAX_EMPTY_RUNS_RETRIES = 3
+_EMPTY_RUNS_SLEEP_SECONDS = 5
+# Number of transfer configs requested per page when listing them.
+_LIST_TRANSFER_CONFIGS_PAGE_SIZE = 100
 
 _ADS_TABLES = [
     'ShoppingProductStats',
@@ -57,6 +78,100 @@ class DataTransferError(Error):
   """An exception to be raised when data transfer was not successful."""
 
 
+@functools.lru_cache(maxsize=None)
+def _datatransfer() -> types.ModuleType:
+  """Returns the bigquery_datatransfer module, importing it on first use.
+
+  The client library registers many proto descriptors at import time, so it is
+  not imported together with this module, e.g. to print the command line help.
+  """
+  from google.cloud import bigquery_datatransfer
+
+  return bigquery_datatransfer
+
+
+def __getattr__(name: str) -> Any:
+  """Resolves TransferConfig for users of this module without importing early.
+
+  Lets callers refer to `cloud_data_transfer.TransferConfig`, e.g. in type
+  annotations evaluated with `typing.get_type_hints`.
+  """
+  if name == 'TransferConfig':
+    return _datatransfer().TransferConfig
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+@functools.lru_cache(maxsize=None)
+def _get_credentials(
+    impersonated_service_account: Optional[str] = None,
+) -> Optional[google.auth.credentials.Credentials]:
+  """Returns credentials for data transfer clients, shared across calls.
+
+  Args:
+    impersonated_service_account: Optional. The email of the service account
+      to impersonate. If None, returns None so that clients use Application
+      Default Credentials.
+  """
+  if not impersonated_service_account:
+    logger.info(
+        'Impersonation mode DISABLED. Using Application Default Credentials.'
+    )
+    return None
+
+  logger.info(
+      'Impersonation mode ENABLED. Using service account: %s',
+      impersonated_service_account,
+  )
+
+  source_credentials, _ = google.auth.default(
+      scopes=['https://www.googleapis.com/auth/cloud-platform']
+  )
+
+  return impersonated_credentials.Credentials(
+      source_credentials=source_credentials,
+      target_principal=impersonated_service_account,
+      target_scopes=['https://www.googleapis.com/auth/cloud-platform'],
+  )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_data_transfer_client(
+    impersonated_service_account: Optional[str] = None,
+) -> bigquery_datatransfer.DataTransferServiceClient:
+  """Returns a data transfer client, shared across calls.
+
+  Args:
+    impersonated_service_account: Optional. The email of the service account
+      to impersonate. If None, uses Application Default Credentials.
+
+  Raises:
+    DefaultCredentialsError: If the credentials could not be determined.
+  """
+  try:
+    return _datatransfer().DataTransferServiceClient(
+        credentials=_get_credentials(impersonated_service_account)
+    )
+  except DefaultCredentialsError as e:
+    logger.error(
+        'Could not determine credentials. Please configure your environment '
+        'with "gcloud auth application-default login" or ensure you are '
+        'running in a configured GCP environment. Error: %s',
+        e,
+    )
+    raise
+
+
+def _to_struct(values: Dict[str, Any]) -> struct_pb2.Struct:
+  """Returns transfer config parameters as a Struct.
+
+  Args:
+    values: Parameter values keyed by parameter name.
+  """
+  parameters = struct_pb2.Struct()
+  parameters.update(values)
+  return parameters
+
+
 class CloudDataTransferUtils:
   """This class provides methods to manage BigQuery data transfers.
 
@@ -79,51 +194,51 @@ class CloudDataTransferUtils:
         to impersonate. If None, uses Application Default Credentials.
     """
     self.project_id = project_id
+    self.impersonated_service_account = impersonated_service_account
+    self.client = _get_data_transfer_client(impersonated_service_account)
+    # Data sources keyed by (data_source_id, dataset_location).
+    self._data_source_cache: Dict[
+        Tuple[str, str], bigquery_datatransfer.DataSource
+    ] = {}
+    # Transfer configs of a data source fetched so far, and the pager yielding
+    # the rest, keyed by (data_source_id, dataset_location). An entry is
+    # dropped whenever a transfer config of its data source is created or
+    # updated.
+    self._transfer_configs_cache: Dict[
+        Tuple[str, str], Tuple[List[TransferConfig], Iterator[TransferConfig]]
+    ] = {}
 
-    try:
-      if impersonated_service_account:
-        logging.info(
-            'Impersonation mode ENABLED. Using service account: %s',
-            impersonated_service_account,
-        )
+  def wait_for_transfer_completion(
+      self, transfer_config: TransferConfig, dataset_location: str
+  ) -> None:
+    """Waits for the completion of data transfer operation.
 
-        source_credentials, _ = google.auth.default(
-            scopes=['https://www.googleapis.com/auth/cloud-platform']
-        )
+    Blocking counterpart of `wait_for_transfer_completion_async`.
 
-        target_credentials = impersonated_credentials.Credentials(
-            source_credentials=source_credentials,
-            target_principal=impersonated_service_account,
-            target_scopes=['https://www.googleapis.com/auth/cloud-platform'],
-        )
+    Args:
+      transfer_config: Resource representing data transfer.
+      dataset_location: Location of the BigQuery dataset.
 
-        self.client = bigquery_datatransfer.DataTransferServiceClient(
-            credentials=target_credentials
-        )
-      else:
-        logging.info(
-            'Impersonation mode DISABLED. Using Application Default '
-            'Credentials.'
+    Raises:
+      DataTransferError: If the data transfer is not successfully completed.
+    """
+    asyncio.run(
+        self.wait_for_transfer_completion_async(
+            transfer_config, dataset_location
         )
-        self.client = bigquery_datatransfer.DataTransferServiceClient()
-
-    except DefaultCredentialsError as e:
-      logging.error(
-          'Could not determine credentials. Please configure your environment '
-          'with "gcloud auth application-default login" or ensure you are '
-          'running in a configured GCP environment. Error: %s',
-          e,
-      )
-      raise
+    )
 
-  def wait_for_transfer_completion(
+  async def wait_for_transfer_completion_async(
       self, transfer_config: TransferConfig, dataset_location: str
   ) -> None:
     """Waits for the completion of data transfer operation.
 
     This method retrieves data transfer operation and checks for its status. If
-    the operation is not completed, then the operation is re-checked after
-    `_SLEEP_SECONDS` seconds.
+    the operation is not completed, then the operation is re-checked with an
+    exponentially growing interval, starting at `_INITIAL_SLEEP_SECONDS` and
+    capped at `_MAX_SLEEP_SECONDS` seconds, plus a random jitter. The event
+    loop is not blocked while waiting, so several transfers can be awaited
+    concurrently.
 
     Args:
       transfer_config: Resource representing data transfer.
@@ -132,59 +247,101 @@ class CloudDataTransferUtils:
     Raises:
       DataTransferError: If the data transfer is not successfully completed.
     """
+    # Async clients are bound to the event loop they are created in, so a new
+    # one is created for every wait.
+    client = _datatransfer().DataTransferServiceAsyncClient(
+        credentials=_get_credentials(self.impersonated_service_account)
+    )
+    try:
+      await self._poll_transfer_runs(client, transfer_config, dataset_location)
+    finally:
+      await client.transport.close()
+
+  async def _poll_transfer_runs(
+      self,
+      client: bigquery_datatransfer.DataTransferServiceAsyncClient,
+      transfer_config: TransferConfig,
+      dataset_location: str,
+  ) -> None:
+    """Polls transfer runs until the latest one is finished."""
+    bigquery_datatransfer = _datatransfer()
     transfer_config_name = transfer_config.name
     transfer_config_id = transfer_config_name.split('/')[-1]
-    poll_counter = 0
+    transfer_config_path = (
+        f'{self._get_parent(dataset_location)}'
+        f'/transferConfigs/{transfer_config_id}'
+    )
+    attempt = 0
+    empty_runs_retries = 0
+    deadline = time.monotonic() + _MAX_WAIT_SECONDS
 
     while True:
-      transfer_config_path = (
-          f'projects/{self.project_id}/locations/{dataset_location}'
-          f'/transferConfigs/{transfer_config_id}'
+      # Only the latest run is inspected, so a single result is requested.
+      response = await client.list_transfer_runs(
+          request={'parent': transfer_config_path, 'page_size': 1}
       )
-      response = self.client.list_transfer_runs(parent=transfer_config_path)
-      latest_transfer = next(iter(response), None)
+      latest_transfer = await anext(aiter(response), None)
 
       if not latest_transfer:
-        logging.info(
+        if empty_runs_retries < _MAX_EMPTY_RUNS_RETRIES:
+          empty_runs_retries += 1
+          logger.info(
+              'No transfer runs found for %s yet. Checking again in %s '
+              'seconds.',
+              transfer_config_name,
+              _EMPTY_RUNS_SLEEP_SECONDS,
+          )
+          await asyncio.sleep(_EMPTY_RUNS_SLEEP_SECONDS)
+          continue
+        logger.info(
             'No transfer runs found for %s. Assuming completion.',
             transfer_config_name,
         )
         return
 
-      if latest_transfer.state == TransferState.SUCCEEDED:
-        logging.info('Transfer %s was successful.', transfer_config_name)
+      if latest_transfer.state == bigquery_datatransfer.TransferState.SUCCEEDED:
+        logger.info('Transfer %s was successful.', transfer_config_name)
         return
 
       if latest_transfer.state in (
-          TransferState.FAILED,
-          TransferState.CANCELLED,
+          bigquery_datatransfer.TransferState.FAILED,
+          bigquery_datatransfer.TransferState.CANCELLED,
       ):
         error_message = (
             f'Transfer {transfer_config_name} was not successful. '
             f'Final state: {latest_transfer.state.name}. '
             f'Error: {latest_transfer.error_status}'
         )
-        logging.error(error_message)
+        logger.error(error_message)
         raise DataTransferError(error_message)
 
-      logging.info(
-          'Transfer %s still in progress (State: %s). Sleeping for %s '
-          'seconds before checking again.',
-          transfer_config_name,
-          latest_transfer.state.name,
-          _SLEEP_SECONDS,
-      )
-      time.sleep(_SLEEP_SECONDS)
-
-      poll_counter += 1
-      if poll_counter >= _MAX_POLL_COUNTER:
+      now = time.monotonic()
+      if now >= deadline:
         error_message = (
             f'Transfer {transfer_config_name} is taking too long to finish. '
-            'Exiting due to max poll attempts.'
+            'Exiting due to max wait time.'
         )
-        logging.error(error_message)
+        logger.error(error_message)
         raise DataTransferError(error_message)
 
+      # The last sleep is shortened so that a final check happens at the
+      # deadline.
+      sleep_seconds = min(
+          min(_MAX_SLEEP_SECONDS, _INITIAL_SLEEP_SECONDS * 2**attempt)
+          + random.uniform(0, _SLEEP_JITTER_SECONDS),
+          deadline - now,
+      )
+
+      logger.info(
+          'Transfer %s still in progress (State: %s). Sleeping for %.0f '
+          'seconds before checking again.',
+          transfer_config_name,
+          latest_transfer.state.name,
+          sleep_seconds,
+      )
+      await asyncio.sleep(sleep_seconds)
+      attempt += 1
+
   def _get_existing_transfer(
       self,
       data_source_id: str,
@@ -192,12 +349,17 @@ class CloudDataTransferUtils:
       destination_dataset_id: Optional[str] = None,
       params: Optional[Dict[str, str]] = None,
       name: Optional[str] = None,
-  ) -> Optional[TransferConfig]:
-    """Gets data transfer if it already exists."""
-    parent = f'projects/{self.project_id}/locations/{dataset_location}'
-    for transfer_config in self.client.list_transfer_configs(parent=parent):
-      if transfer_config.data_source_id != data_source_id:
-        continue
+  ) -> Tuple[Optional[TransferConfig], bool]:
+    """Gets data transfer if it already exists.
+
+    Returns:
+      Tuple of the matching transfer config, or None if there is none, and
+      whether non-empty `params` were given and matched by the config.
+    """
+    bigquery_datatransfer = _datatransfer()
+    for transfer_config in self._iter_transfer_configs(
+        data_source_id, dataset_location
+    ):
       if (
           destination_dataset_id
           and transfer_config.destination_dataset_id != destination_dataset_id
@@ -206,16 +368,66 @@ class CloudDataTransferUtils:
 
       # Ignore transfers that are already in a failed or cancelled state.
       is_valid_state = transfer_config.state in (
-          TransferState.PENDING,
-          TransferState.RUNNING,
-          TransferState.SUCCEEDED,
+          bigquery_datatransfer.TransferState.PENDING,
+          bigquery_datatransfer.TransferState.RUNNING,
+          bigquery_datatransfer.TransferState.SUCCEEDED,
       )
-      params_match = self._check_params_match(transfer_config, params)
       name_matches = name is None or name == transfer_config.display_name
 
-      if params_match and is_valid_state and name_matches:
-        return transfer_config
-    return None
+      # Params are compared last as it is the most expensive check.
+      if (
+          is_valid_state
+          and name_matches
+          and self._check_params_match(transfer_config, params)
+      ):
+        return transfer_config, bool(params)
+    return None, False
+
+  def _iter_transfer_configs(
+      self, data_source_id: str, dataset_location: str
+  ) -> Iterator[TransferConfig]:
+    """Yields transfer configs of the data source, listed once per instance.
+
+    Pages are only requested when iteration reaches them, and the configs
+    fetched so far are kept for later calls. A caller that stops at a match on
+    the first page therefore never requests the remaining pages.
+
+    Args:
+      data_source_id: Data source ID.
+      dataset_location: Location of the BigQuery dataset.
+    """
+    key = (data_source_id, dataset_location)
+    entry = self._transfer_configs_cache.get(key)
+    if entry is None:
+      request = _datatransfer().ListTransferConfigsRequest(
+          parent=self._get_parent(dataset_location),
+          data_source_ids=[data_source_id],
+          page_size=_LIST_TRANSFER_CONFIGS_PAGE_SIZE,
+      )
+      entry = ([], iter(self.client.list_transfer_configs(request=request)))
+      self._transfer_configs_cache[key] = entry
+    configs, pager = entry
+
+    index = 0
+    while True:
+      if index == len(configs):
+        transfer_config = next(pager, None)
+        if transfer_config is None:
+          return
+        configs.append(transfer_config)
+      yield configs[index]
+      index += 1
+
+  def _invalidate_transfer_configs(
+      self, data_source_id: str, dataset_location: str
+  ) -> None:
+    """Drops cached transfer configs of the data source.
+
+    Args:
+      data_source_id: Data source ID.
+      dataset_location: Location of the BigQuery dataset.
+    """
+    self._transfer_configs_cache.pop((data_source_id, dataset_location), None)
 
   def _check_params_match(
       self,
@@ -225,37 +437,51 @@ class CloudDataTransferUtils:
     """Checks if given parameters are present in transfer config."""
     if not params:
       return True
-    for key, value in params.items():
-      config_params = transfer_config.params
-      if key not in config_params or config_params[key] != value:
-        return False
-    return True
+    config_params = dict(transfer_config.params)
+    return all(
+        key in config_params and config_params[key] == value
+        for key, value in params.items()
+    )
 
   def _update_existing_transfer(
       self,
       transfer_config: TransferConfig,
+      dataset_location: str,
       params: struct_pb2.Struct,
+      params_match: bool = False,
   ) -> TransferConfig:
-    """Updates existing data transfer if parameters have changed."""
-    if self._check_params_match(transfer_config, params):
-      logging.info(
+    """Updates existing data transfer if parameters have changed.
+
+    Args:
+      transfer_config: Existing data transfer config.
+      dataset_location: Location of the BigQuery dataset.
+      params: Expected parameters of the data transfer.
+      params_match: Whether `params` are already known to match the config,
+        in which case they are not compared again.
+    """
+    bigquery_datatransfer = _datatransfer()
+    if params_match or self._check_params_match(transfer_config, params):
+      logger.info(
           'The data transfer config "%s" parameters already match. '
           'Skipping update.',
           transfer_config.display_name,
       )
       return transfer_config
 
-    new_transfer_config = copy.deepcopy(transfer_config)
-    new_transfer_config.params.clear()
-    new_transfer_config.params.update(params)
-
-    # The update_mask ensures that only the 'params' field is modified.
+    # The update_mask ensures that only the 'params' field is modified, so only
+    # the name and the new params need to be sent.
+    new_transfer_config = bigquery_datatransfer.TransferConfig(
+        name=transfer_config.name, params=params
+    )
     update_mask = {'paths': ['params']}
     request = bigquery_datatransfer.UpdateTransferConfigRequest(
         transfer_config=new_transfer_config, update_mask=update_mask
     )
     new_transfer_config = self.client.update_transfer_config(request)
-    logging.info(
+    self._invalidate_transfer_configs(
+        transfer_config.data_source_id, dataset_location
+    )
+    logger.info(
         'The data transfer config "%s" parameters were updated.',
         new_transfer_config.display_name,
     )
@@ -265,9 +491,9 @@ class CloudDataTransferUtils:
       self, merchant_id: str, destination_dataset: str, dataset_location: str
   ) -> TransferConfig:
     """Creates a new merchant center transfer."""
-    logging.info('Creating Merchant Center Transfer.')
-    parameters = struct_pb2.Struct()
-    parameters.update({
+    bigquery_datatransfer = _datatransfer()
+    logger.info('Creating Merchant Center Transfer.')
+    parameters = _to_struct({
         'merchant_id': merchant_id,
         'export_products': True,
         'export_performance': True,
@@ -277,22 +503,27 @@ class CloudDataTransferUtils:
         'export_offer_targeting': True,
     })
 
-    existing_transfer = self._get_existing_transfer(
+    existing_transfer, params_match = self._get_existing_transfer(
         _MERCHANT_CENTER_ID,
         dataset_location,
         destination_dataset_id=destination_dataset,
         params=parameters,
     )
     if existing_transfer:
-      logging.info(
+      logger.info(
           'Data transfer for merchant id %s to destination dataset %s '
           'already exists.',
           merchant_id,
           destination_dataset,
       )
-      return self._update_existing_transfer(existing_transfer, parameters)
+      return self._update_existing_transfer(
+          existing_transfer,
+          dataset_location,
+          parameters,
+          params_match=params_match,
+      )
 
-    logging.info(
+    logger.info(
         'Creating data transfer for merchant id %s to destination dataset %s',
         merchant_id,
         destination_dataset,
@@ -305,8 +536,8 @@ class CloudDataTransferUtils:
       version_info = self._get_version_info(
           _MERCHANT_CENTER_ID, dataset_location
       )
-    parent = f'projects/{self.project_id}/locations/{dataset_location}'
-    input_config = TransferConfig(
+    parent = self._get_parent(dataset_location)
+    input_config = bigquery_datatransfer.TransferConfig(
         display_name=f'Merchant Center Transfer - {merchant_id}',
         data_source_id=_MERCHANT_CENTER_ID,
         destination_dataset_id=destination_dataset,
@@ -319,7 +550,8 @@ class CloudDataTransferUtils:
         version_info=version_info,
     )
     transfer_config = self.client.create_transfer_config(request)
-    logging.info(
+    self._invalidate_transfer_configs(_MERCHANT_CENTER_ID, dataset_location)
+    logger.info(
         'Data transfer created for merchant id %s to destination dataset %s.',
         merchant_id,
         destination_dataset,
@@ -334,22 +566,22 @@ class CloudDataTransferUtils:
       backfill_days: int = 30,
   ) -> TransferConfig:
     """Creates a new Google Ads transfer and schedules a backfill."""
-    logging.info('Creating Google Ads Transfer.')
+    bigquery_datatransfer = _datatransfer()
+    logger.info('Creating Google Ads Transfer.')
 
-    parameters = struct_pb2.Struct()
-    parameters.update({
+    parameters = _to_struct({
         'customer_id': customer_id,
         'include_pmax': True,
         'table_filter': ','.join(_ADS_TABLES),
     })
-    existing_transfer = self._get_existing_transfer(
+    existing_transfer, _ = self._get_existing_transfer(
         _GOOGLE_ADS_ID,
         dataset_location,
         destination_dataset_id=destination_dataset,
         params=parameters,
     )
     if existing_transfer:
-      logging.info(
+      logger.info(
           'Data transfer for Google Ads customer id %s to destination dataset '
           '%s already exists.',
           customer_id,
@@ -357,7 +589,7 @@ class CloudDataTransferUtils:
       )
       return existing_transfer
 
-    logging.info(
+    logger.info(
         'Creating data transfer for Google Ads customer id %s to destination '
         'dataset %s.',
         customer_id,
@@ -371,8 +603,8 @@ class CloudDataTransferUtils:
       version_info = self._get_version_info(
           _GOOGLE_ADS_ID, dataset_location
       )
-    parent = f'projects/{self.project_id}/locations/{dataset_location}'
-    input_config = TransferConfig(
+    parent = self._get_parent(dataset_location)
+    input_config = bigquery_datatransfer.TransferConfig(
         display_name=f'Google Ads Transfer - {customer_id}',
         data_source_id=_GOOGLE_ADS_ID,
         destination_dataset_id=destination_dataset,
@@ -385,51 +617,60 @@ class CloudDataTransferUtils:
         version_info=version_info,
     )
     transfer_config = self.client.create_transfer_config(request=request)
-    logging.info(
+    self._invalidate_transfer_configs(_GOOGLE_ADS_ID, dataset_location)
+    logger.info(
         'Data transfer created for Google Ads customer id %s.',
         customer_id,
     )
 
     if backfill_days > 0:
-      logging.info('Scheduling backfill for the last %d days.', backfill_days)
-      now_utc = datetime.datetime.now(pytz.utc)
-      start_time = now_utc - datetime.timedelta(days=backfill_days)
-      end_time = now_utc
+      logger.info('Scheduling backfill for the last %d days.', backfill_days)
+      today_utc = datetime.datetime.now(datetime.timezone.utc).replace(
+          hour=0, minute=0, second=0, microsecond=0
+      )
       start_time_pb = timestamp_pb2.Timestamp()
       end_time_pb = timestamp_pb2.Timestamp()
       start_time_pb.FromDatetime(
-          start_time.replace(hour=0, minute=0, second=0, microsecond=0)
-      )
-      end_time_pb.FromDatetime(
-          end_time.replace(hour=0, minute=0, second=0, microsecond=0)
+          today_utc - datetime.timedelta(days=backfill_days)
       )
+      end_time_pb.FromDatetime(today_utc)
 
-      self.client.schedule_transfer_runs(
+      request = bigquery_datatransfer.StartManualTransferRunsRequest(
           parent=transfer_config.name,
-          start_time=start_time_pb,
-          end_time=end_time_pb,
+          requested_time_range=(
+              bigquery_datatransfer.StartManualTransferRunsRequest.TimeRange(
+                  start_time=start_time_pb, end_time=end_time_pb
+              )
+          ),
       )
+      self.client.start_manual_transfer_runs(request=request)
     return transfer_config
 
   def schedule_query(
       self, name: str, dataset_location: str, query_string: str
   ) -> TransferConfig:
     """Schedules a query to run daily."""
-    parameters = struct_pb2.Struct()
-    parameters['query'] = query_string
+    bigquery_datatransfer = _datatransfer()
+    # The only parameter is a string, so its Value is built directly.
+    parameters = struct_pb2.Struct(
+        fields={'query': struct_pb2.Value(string_value=query_string)}
+    )
 
-    existing_transfer = self._get_existing_transfer(
+    existing_transfer, params_match = self._get_existing_transfer(
         _SCHEDULED_QUERY_ID, dataset_location, name=name
     )
 
     if existing_transfer:
-      logging.info('Scheduled query "%s" already exists. Updating...', name)
+      logger.info('Scheduled query "%s" already exists. Updating...', name)
       updated_transfer_config = self._update_existing_transfer(
-          existing_transfer, parameters
+          existing_transfer,
+          dataset_location,
+          parameters,
+          params_match=params_match,
       )
-      logging.info('Triggering a manual run for the updated query.')
+      logger.info('Triggering a manual run for the updated query.')
       start_time_pb = timestamp_pb2.Timestamp()
-      start_time_pb.FromDatetime(datetime.datetime.now(pytz.utc))
+      start_time_pb.FromDatetime(datetime.datetime.now(datetime.timezone.utc))
       request = bigquery_datatransfer.StartManualTransferRunsRequest(
           parent=updated_transfer_config.name,
           requested_run_time=start_time_pb,
@@ -444,8 +685,8 @@ class CloudDataTransferUtils:
       version_info = self._get_version_info(
           'scheduled_query', dataset_location
       )
-    parent = f'projects/{self.project_id}/locations/{dataset_location}'
-    input_config = TransferConfig(
+    parent = self._get_parent(dataset_location)
+    input_config = bigquery_datatransfer.TransferConfig(
         display_name=name,
         data_source_id=_SCHEDULED_QUERY_ID,
         params=parameters,
@@ -457,18 +698,42 @@ class CloudDataTransferUtils:
         version_info=version_info,
     )
     transfer_config = self.client.create_transfer_config(request=request)
-    logging.info('Scheduled query "%s" created successfully.', name)
+    self._invalidate_transfer_configs(
+        _SCHEDULED_QUERY_ID, dataset_location
+    )
+    logger.info('Scheduled query "%s" created successfully.', name)
     return transfer_config
 
+  def _get_parent(self, dataset_location: str) -> str:
+    """Returns resource name of the project location.
+
+    Args:
+      dataset_location: Location of the BigQuery dataset.
+    """
+    return f'projects/{self.project_id}/locations/{dataset_location}'
+
+  def _get_data_source_name(
+      self, data_source_id: str, dataset_location: str
+  ) -> str:
+    """Returns resource name of the data source.
+
+    Args:
+      data_source_id: Data source ID.
+      dataset_location: Location of the BigQuery dataset.
+    """
+    return (
+        f'{self._get_parent(dataset_location)}/dataSources/{data_source_id}'
+    )
+
   def _get_data_source(
       self, data_source_id: str, dataset_location: str
   ) -> bigquery_datatransfer.DataSource:
-    """Returns data source details."""
-    name = (
-        f'projects/{self.project_id}/locations/{dataset_location}/'
-        f'dataSources/{data_source_id}'
-    )
-    return self.client.get_data_source(name=name)
+    """Returns data source details, fetched once per data source."""
+    key = (data_source_id, dataset_location)
+    if key not in self._data_source_cache:
+      name = self._get_data_source_name(data_source_id, dataset_location)
+      self._data_source_cache[key] = self.client.get_data_source(name=name)
+    return self._data_source_cache[key]
 
   def _check_valid_credentials(
       self, data_source_id: str, dataset_location: str
@@ -479,7 +744,7 @@ class CloudDataTransferUtils:
       data_source_id: Data source ID.
       dataset_location: Location of the BigQuery dataset.
     """
-    name = f'projects/{self.project_id}/locations/{dataset_location}/dataSources/{data_source_id}'
+    name = self._get_data_source_name(data_source_id, dataset_location)
     response = self.client.check_valid_creds({'name': name})
     return response.has_valid_creds
 
@@ -22,17 +22,17 @@ This module automates the following 4 steps:
   4. Create a scheduled query to run the main workflow.
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
 import logging
 
 import cloud_bigquery
 import cloud_data_transfer
 from plugins.cloud_utils import cloud_api
 
-# Set logging level.
-logging.getLogger().setLevel(logging.INFO)
-# Suppress noisy logs from the API client library.
-logging.getLogger('googleapiclient.discovery').setLevel(logging.WARNING)
+logger = logging.getLogger(__name__)
 
 # Required Cloud APIs to be enabled.
 _APIS_TO_BE_ENABLED = [
@@ -41,6 +41,20 @@ _APIS_TO_BE_ENABLED = [
 ]
 _DEFAULT_DATASET_ID = 'merch_intel'
 _DEFAULT_DATASET_LOCATION = 'us'
+# Argument values that are parsed as True.
+_TRUTHY_VALUES = frozenset({'true', 't', 'yes', 'y', '1'})
+
+
+def configure_logging() -> None:
+  """Logs INFO messages of Merch Intel modules, WARNING of other libraries."""
+  logging.basicConfig(level=logging.WARNING)
+  for module_logger in (
+      logger,
+      cloud_bigquery.logger,
+      cloud_data_transfer.logger,
+      logging.getLogger('plugins'),
+  ):
+    module_logger.setLevel(logging.INFO)
 
 
 def enable_apis(project_id: str) -> None:
@@ -55,10 +69,67 @@ def enable_apis(project_id: str) -> None:
 
 def parse_boolean(arg: str):
   """Returns boolean representation of argument."""
-  arg = str(arg).lower()
-  if 'true'.startswith(arg):
-    return True
-  return False
+  return str(arg).strip().lower() in _TRUTHY_VALUES
+
+
+async def _wait_for_merchant_center_transfer(
+    data_transfer: cloud_data_transfer.CloudDataTransferUtils,
+    merchant_center_config: cloud_data_transfer.TransferConfig,
+    dataset_location: str,
+) -> None:
+  """Waits for GMC data transfer, explaining first run failures."""
+  try:
+    await data_transfer.wait_for_transfer_completion_async(
+        merchant_center_config, dataset_location
+    )
+    logger.info('GMC data transfer successful.')
+  except cloud_data_transfer.DataTransferError:
+    logger.error(
+        'GMC transfer failed. If this is the first run, you may need to wait '
+        'up to 90 minutes for data to be prepared before the transfer can '
+        'succeed.'
+    )
+    raise
+
+
+async def _wait_for_ads_transfer(
+    data_transfer: cloud_data_transfer.CloudDataTransferUtils,
+    ads_config: cloud_data_transfer.TransferConfig,
+    dataset_location: str,
+) -> None:
+  """Waits for Google Ads data transfer."""
+  await data_transfer.wait_for_transfer_completion_async(
+      ads_config, dataset_location
+  )
+  logger.info('Google Ads data transfer successful.')
+
+
+async def wait_for_transfers(
+    data_transfer: cloud_data_transfer.CloudDataTransferUtils,
+    merchant_center_config: cloud_data_transfer.TransferConfig,
+    ads_config: cloud_data_transfer.TransferConfig,
+    dataset_location: str,
+) -> None:
+  """Waits for GMC and Google Ads data transfers to complete concurrently.
+
+  Args:
+    data_transfer: Data transfer utils used to create the transfers.
+    merchant_center_config: Merchant Center data transfer.
+    ads_config: Google Ads data transfer.
+    dataset_location: Location of the BigQuery dataset.
+
+  Raises:
+    DataTransferError: If any of the data transfers is not successful.
+  """
+  logger.info(
+      'Waiting for GMC and Google Ads data transfers to complete initial run...'
+  )
+  await asyncio.gather(
+      _wait_for_merchant_center_transfer(
+          data_transfer, merchant_center_config, dataset_location
+      ),
+      _wait_for_ads_transfer(data_transfer, ads_config, dataset_location),
+  )
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -110,11 +181,11 @@ def main():
       args.project_id, args.service_account_email
   )
 
-  logging.info('Enabling APIs...')
+  logger.info('Enabling APIs...')
   enable_apis(args.project_id)
-  logging.info('APIs enabled.')
+  logger.info('APIs enabled.')
 
-  logging.info('Creating dataset "%s"...', args.dataset_id)
+  logger.info('Creating dataset "%s"...', args.dataset_id)
   cloud_bigquery.create_dataset_if_not_exists(
       args.project_id, args.dataset_id, args.dataset_location
   )
@@ -126,30 +197,19 @@ def main():
       ads_customer_id, args.dataset_id, args.dataset_location
   )
 
-  try:
-    logging.info('Waiting for GMC data transfer to complete initial run...')
-    data_transfer.wait_for_transfer_completion(
-        merchant_center_config, args.dataset_location
-    )
-    logging.info('GMC data transfer successful.')
-  except cloud_data_transfer.DataTransferError:
-    logging.error(
-        'GMC transfer failed. If this is the first run, you may need to wait '
-        'up to 90 minutes for data to be prepared before the transfer can '
-        'succeed.'
-    )
-    raise
-
-  logging.info(
-      'Waiting for GMC data transfer to complete initial run...'
+  asyncio.run(
+      wait_for_transfers(
+          data_transfer,
+          merchant_center_config,
+          ads_config,
+          args.dataset_location,
+      )
   )
-  data_transfer.wait_for_transfer_completion(ads_config, args.dataset_location)
-  logging.info('Google Ads data transfer successful.')
 
   cloud_bigquery.load_language_codes(args.project_id, args.dataset_id)
   cloud_bigquery.load_geo_targets(args.project_id, args.dataset_id)
 
-  logging.info('Creating Merch Intel tables and views...')
+  logger.info('Creating Merch Intel tables and views...')
   cloud_bigquery.execute_queries(
       args.project_id,
       args.dataset_id,
@@ -157,9 +217,9 @@ def main():
       args.merchant_id,
       ads_customer_id,
   )
-  logging.info('Merch Intel tables and views created.')
+  logger.info('Merch Intel tables and views created.')
 
-  logging.info('Scheduling the main workflow...')
+  logger.info('Scheduling the main workflow...')
   query = cloud_bigquery.get_main_workflow_sql(
       args.project_id, args.dataset_id, args.merchant_id, ads_customer_id
   )
@@ -168,9 +228,10 @@ def main():
       args.dataset_location,
       query,
   )
-  logging.info('Main workflow scheduled successfully.')
-  logging.info('Merch Intel installation is complete!')
+  logger.info('Main workflow scheduled successfully.')
+  logger.info('Merch Intel installation is complete!')
 
 
 if __name__ == '__main__':
+  configure_logging()
   main()
@@ -27,6 +27,8 @@ import requests.exceptions
 
 _SERVICE_URL = 'https://serviceusage.googleapis.com/v1/projects'
 
+logger = logging.getLogger(__name__)
+
 
 class Error(Exception):
   """A generic error thrown for any exceptions in cloud_api module."""
@@ -82,7 +84,7 @@ class CloudApiUtils(object):
       operation = utils.execute_request(request)
       utils.wait_for_operation(self.client.operations(), operation)
     except errors.HttpError as error:
-      logging.exception('Error occurred while enabling Cloud APIs.')
+      logger.exception('Error occurred while enabling Cloud APIs.')
       raise Error('Error occurred while enabling Cloud APIs.') from error
 
 
@@ -101,7 +103,7 @@ def post_request(session: AuthorizedSession, url: str, data: Any) -> None:
     response = session.post(url, data)
     response.raise_for_status()
   except requests.exceptions.HTTPError as error:
-    logging.exception(
+    logger.exception(
         'HTTPError "%s" "%s": post_request failed',
         error.response.status_code,
         error.response.reason,
@@ -124,7 +126,7 @@ def disable_api(session: AuthorizedSession, project_id: str, api: str) -> None:
   disable_api_url = '{}/{}/services/{}:disable'.format(
       _SERVICE_URL, project_id, api
   )
-  logging.info(
+  logger.info(
       'Disabling following API for "%s" project : "%s".', project_id, api
   )
   post_request(session, disable_api_url, {'disableDependentServices': True})
@@ -37,6 +37,8 @@ _NOT_FOUND_ERROR_CODE = 404
 # Scope to manage service accounts
 _SCOPE = 'https://www.googleapis.com/auth/cloud-platform'
 
+logger = logging.getLogger(__name__)
+
 
 class Error(Exception):
   """A generic error thrown for any exceptions in cloud_auth module."""
@@ -194,7 +196,7 @@ def create_service_account(
   )
   if service_account_details:
     return service_account_details
-  logging.info(
+  logger.info(
       'Creating "%s" service account in "%s" project',
       service_account_name,
       project_id,
@@ -227,7 +229,7 @@ def get_service_account(
     None: If no service account is found.
   """
   try:
-    logging.info(
+    logger.info(
         'Retrieving "%s" service account in "%s" project',
         service_account_name,
         project_id,
@@ -244,7 +246,7 @@ def get_service_account(
   except errors.HttpError as error:
     if error.resp.status == _NOT_FOUND_ERROR_CODE:
       return None
-    logging.exception(
+    logger.exception(
         'Error occurred while retrieving service account: "%s".', error
     )
     raise Error('Error occurred while retrieving service account.') from error
@@ -276,7 +278,7 @@ def _create_service_account_key(
   """
   name = 'projects/{p}/serviceAccounts/{s}@{p}.iam.gserviceaccount.com'.format(
       p=project_id, s=service_account_name)
-  logging.info(
+  logger.info(
       'Creating service account key for "%s" service account in "%s" project',
       service_account_name,
       project_id,
@@ -305,7 +307,7 @@ def set_service_account_role(
       doesn't need "roles/" prefix to be added. Allowed values -
       https://cloud.google.com/iam/docs/understanding-roles. e.g. - editor
   """
-  logging.info(
+  logger.info(
       'Adding "%s" role to "%s" service account in "%s" project',
       role_name,
       service_account_name,
@@ -35,6 +35,8 @@ _RETRIABLE_STATUS_CODES = (
     503,
 )  # Service Unavailable
 
+logger = logging.getLogger(__name__)
+
 
 class Error(Exception):
   """A generic error thrown for any exception in utils module."""
@@ -98,16 +100,16 @@ def wait_for_operation(
     request = operation_client.get(name=operation['name'])
     updated_operation = execute_request(request)
     if updated_operation.get('done'):
-      logging.info('Operation "%s" successfully completed.', operation['name'])
+      logger.info('Operation "%s" successfully completed.', operation['name'])
       return
     if updated_operation.get('error'):
-      logging.info(
+      logger.info(
           'Operation "%s" failed to complete successfully.', operation['name'])
       raise Error(
           f'Operation {operation["name"]} not completed. Error Details - '
           f'{updated_operation["error"]}'
       )
-    logging.info(
+    logger.info(
         'Operation "%s" still in progress. Sleeping for '
         '"%s" seconds before retrying.', operation['name'],
         _WAIT_FOR_OPERATION_SLEEP_SECONDS)